@@ -13,19 +13,23 @@
 # limitations under the License.
 
 import os.path
+from pathlib import Path
 import sqlite3
 import sys
 import time
 import traceback
 
 
-def connect_to_database(db_path="../db/io.db", timeout=5, detect_types=0):
+def connect_to_database(db_path="../db/io.db", timeout=5, detect_types=0,
+                        read_only=False):
     """
     :param db_path: str, the path to the database, relative to the
         current working directory, defaults to "../db/io.db"
     :param timeout: int, number of seconds the connection should wait for the
         database lock to go away before raising an exception, defaults to 5
     :param detect_types: int, type detection parameter, defaults to 0
+    :param read_only: boolean, whether to open the database in read-only
+        mode, defaults to False
     :return: the sqlite3 database connection object
 
     Connect to a database and return the connection object.
@@ -39,7 +43,17 @@ def connect_to_database(db_path="../db/io.db", timeout=5, detect_types=0):
             )
         )
 
-    conn = sqlite3.connect(db_path, timeout=timeout, detect_types=detect_types)
+    if read_only:
+        # Build the URI with pathlib, so that characters like '#' and '%' in
+        # the path are escaped rather than read as part of the URI
+        conn = sqlite3.connect(
+            Path(db_path).resolve().as_uri() + "?mode=ro", uri=True,
+            timeout=timeout, detect_types=detect_types
+        )
+    else:
+        conn = sqlite3.connect(
+            db_path, timeout=timeout, detect_types=detect_types
+        )
 
     # Enforce foreign keys (default = not enforced)
     conn.execute("PRAGMA foreign_keys=ON;")
@@ -622,43 +622,62 @@ def validate_piecewise_curves(df, x_col, slope_col, y_name):
     :return:
     """
     results = []
-    # TODO: might be able to do this with groupby and a flexible idx
-    #  Or could simply do the validation on x_values, slopes and do
-    #  pre-processing outside of function
-    uniques = df.drop_duplicates(["project", "period"])[["project", "period"]]
-    for project, period in uniques.itertuples(index=False, name=None):
-        df_slice = df[(df["project"] == project) & (df["period"] == period)]
-        df_slice = df_slice.sort_values(by=[x_col])
-        x_values = df_slice[x_col].values
-        avg_slopes = df_slice[slope_col].values
-
-        if len(x_values) > 1:
-            incr_x = np.diff(x_values)
-
-            if np.any(incr_x == 0):
-                # note: primary key should already prohibit this
+
+    # Number the project-periods in the order in which they first appear and
+    # sort each curve by its x values, so that the increments below can be
+    # computed for all curves at once
+    group_ids = df.groupby(["project", "period"], sort=False).ngroup()
+    curves = df.assign(
+        group_id=group_ids, y_value=df[x_col] * df[slope_col]
+    )
+    curves = curves[curves["group_id"] >= 0].sort_values(
+        by=["group_id", x_col]
+    )
+
+    # Increments within each curve (NaN for the first point of a curve)
+    by_curve = curves.groupby("group_id")
+    incr_x = by_curve[x_col].diff()
+    incr_y = by_curve["y_value"].diff()
+    # Curves with identical x values are reported as such below, so skip
+    # them here rather than dividing by zero
+    incr_slopes = incr_y / incr_x.where(incr_x != 0)
+    incr_incr_slopes = incr_slopes.groupby(curves["group_id"]).diff()
+
+    checks = pd.DataFrame({
+        "project": curves["project"],
+        "period": curves["period"],
+        "identical_x": incr_x == 0,
+        "non_increasing_y": incr_y <= 0,
+        "non_convex": incr_incr_slopes <= 0
+    }).groupby(curves["group_id"]).agg({
+        "project": "first",
+        "period": "first",
+        "identical_x": "any",
+        "non_increasing_y": "any",
+        "non_convex": "any"
+    })
+
+    for curve in checks.itertuples():
+        if curve.identical_x:
+            # note: primary key should already prohibit this
+            results.append(
+                "project-period '{}-{}': {} values can not be "
+                "identical"
+                .format(curve.project, curve.period, x_col)
+            )
+        else:
+            if curve.non_increasing_y:
+                results.append(
+                    "project-period '{}-{}': {} should increase with "
+                    "increasing load"
+                    .format(curve.project, curve.period, y_name)
+                )
+            if curve.non_convex:
                 results.append(
-                    "project-period '{}-{}': {} values can not be "
-                    "identical"
-                    .format(project, period, x_col)
+                    "project-period '{}-{}': {} curve should be convex, "
+                    "i.e. the slope should increase with increasing {}"
+                    .format(curve.project, curve.period, y_name, x_col)
                 )
-            else:
-                y = x_values * avg_slopes
-                incr_y = np.diff(y)
-                incr_slopes = incr_y / incr_x
-
-                if np.any(incr_y <= 0):
-                    results.append(
-                        "project-period '{}-{}': {} should increase with "
-                        "increasing load"
-                        .format(project, period, y_name)
-                    )
-                if np.any(np.diff(incr_slopes) <= 0):
-                    results.append(
-                        "project-period '{}-{}': {} curve should be convex, "
-                        "i.e. the slope should increase with increasing {}"
-                        .format(project, period, y_name, x_col)
-                    )
 
     return results
 
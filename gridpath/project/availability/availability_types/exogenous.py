@@ -24,6 +24,7 @@ optimization.
 
 import csv
 import os.path
+import pandas as pd
 from pyomo.environ import Param, Set, PercentFraction
 
 from gridpath.auxiliary.auxiliary import cursor_to_df
@@ -135,10 +136,14 @@ def load_module_specific_data(
         "project_availability_exogenous.tab"
     )
 
+    # Missing derates are written as "."; skip them so that the param
+    # default is used
     if os.path.exists(availability_file):
-        data_portal.load(
-            filename=availability_file,
-            param=m.avl_exog_derate
+        df = pd.read_csv(availability_file, sep="\t", na_values=".")
+        df = df.dropna(subset=["availability_derate"])
+        data_portal.data()["avl_exog_derate"] = dict(
+            zip(zip(df["project"].tolist(), df["timepoint"].tolist()),
+                df["availability_derate"].astype(float).tolist())
         )
     else:
         pass
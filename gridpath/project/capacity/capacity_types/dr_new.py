@@ -379,8 +379,9 @@ def load_module_specific_data(
 
         return projects, max_fraction
 
-    data_portal.data()["DR_NEW"] = {None: determine_projects()[0]}
-    data_portal.data()["dr_new_min_duration"] = determine_projects()[1]
+    dr_new_projects, min_duration = determine_projects()
+    data_portal.data()["DR_NEW"] = {None: dr_new_projects}
+    data_portal.data()["dr_new_min_duration"] = min_duration
 
     data_portal.load(
         filename=os.path.join(
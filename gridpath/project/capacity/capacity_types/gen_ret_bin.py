@@ -299,14 +299,17 @@ def load_module_specific_data(
             gen_ret_bin_capacity_mw_dict, \
             gen_ret_bin_fixed_cost_per_mw_yr_dict
 
+    generator_period_list, capacity_mw_dict, fixed_cost_per_mw_yr_dict = \
+        determine_period_params()
+
     data_portal.data()["GEN_RET_BIN_OPR_PRDS"] = \
-        {None: determine_period_params()[0]}
+        {None: generator_period_list}
 
     data_portal.data()["gen_ret_bin_capacity_mw"] = \
-        determine_period_params()[1]
+        capacity_mw_dict
 
     data_portal.data()["gen_ret_bin_fixed_cost_per_mw_yr"] = \
-        determine_period_params()[2]
+        fixed_cost_per_mw_yr_dict
 
 
 def export_module_specific_results(
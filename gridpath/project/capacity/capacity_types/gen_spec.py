@@ -39,6 +39,7 @@ from gridpath.auxiliary.dynamic_components import \
 from gridpath.auxiliary.validations import get_projects, get_expected_dtypes, \
     write_validation_to_database, validate_dtypes, validate_values, \
     validate_idxs, validate_missing_inputs
+from gridpath.project.common_functions import read_projects_tab
 
 
 def add_model_components(m, d, scenario_directory, subproblem, stage):
@@ -158,50 +159,40 @@ def load_module_specific_data(
         :return:
         """
 
-        gen_spec_projects = list()
+        df = read_projects_tab(scenario_directory, subproblem, stage)
 
-        df = pd.read_csv(
-            os.path.join(scenario_directory, str(subproblem), str(stage), "inputs",
-                         "projects.tab"),
-            sep="\t",
-            usecols=["project", "capacity_type"]
-        )
-
-        for row in zip(df["project"],
-                       df["capacity_type"]):
-            if row[1] == "gen_spec":
-                gen_spec_projects.append(row[0])
-            else:
-                pass
+        gen_spec_projects = \
+            df.loc[df["capacity_type"] == "gen_spec", "project"].tolist()
 
         return gen_spec_projects
 
     def determine_period_params():
         generators_list = determine_gen_spec_projects()
-        generator_period_list = list()
-        gen_spec_capacity_mw_dict = dict()
-        gen_spec_fixed_cost_per_mw_yr_dict = dict()
+        # Read the project names as a categorical so that each name is
+        # stored once and the same string object is shared by all of the
+        # (project, period) keys built below
         df = pd.read_csv(
             os.path.join(scenario_directory, str(subproblem), str(stage), "inputs",
                          "specified_generation_period_params.tab"),
-            sep="\t"
+            sep="\t",
+            dtype={"project": "category"}
         )
+        df = df[df["project"].isin(generators_list)]
 
-        for row in zip(df["project"],
-                       df["period"],
-                       df["specified_capacity_mw"],
-                       df["fixed_cost_per_mw_yr"]):
-            if row[0] in generators_list:
-                generator_period_list.append((row[0], row[1]))
-                gen_spec_capacity_mw_dict[(row[0], row[1])] = \
-                    float(row[2])
-                gen_spec_fixed_cost_per_mw_yr_dict[(row[0], row[1])] = \
-                    float(row[3])
-            else:
-                pass
-
-        gen_w_params = [gp[0] for gp in generator_period_list]
-        diff = list(set(generators_list) - set(gen_w_params))
+        generator_period_list = list(
+            zip(df["project"].tolist(), df["period"].tolist())
+        )
+        gen_spec_capacity_mw_dict = dict(
+            zip(generator_period_list,
+                df["specified_capacity_mw"].astype(float).tolist())
+        )
+        gen_spec_fixed_cost_per_mw_yr_dict = dict(
+            zip(generator_period_list,
+                df["fixed_cost_per_mw_yr"].astype(float).tolist())
+        )
+
+        gen_w_params = set(df["project"].unique())
+        diff = [g for g in generators_list if g not in gen_w_params]
         if diff:
             raise ValueError("Missing capacity/fixed cost inputs for the "
                              "following gen_spec projects: {}".format(diff))
@@ -210,14 +201,17 @@ def load_module_specific_data(
             gen_spec_capacity_mw_dict, \
             gen_spec_fixed_cost_per_mw_yr_dict
 
+    generator_period_list, capacity_mw_dict, fixed_cost_per_mw_yr_dict = \
+        determine_period_params()
+
     data_portal.data()["GEN_SPEC_OPR_PRDS"] = \
-        {None: determine_period_params()[0]}
+        {None: generator_period_list}
 
     data_portal.data()["gen_spec_capacity_mw"] = \
-        determine_period_params()[1]
+        capacity_mw_dict
 
     data_portal.data()["gen_spec_fixed_cost_per_mw_yr"] = \
-        determine_period_params()[2]
+        fixed_cost_per_mw_yr_dict
 
 
 # Database
@@ -282,36 +276,27 @@ def write_module_specific_model_inputs(
     ep_capacities = get_module_specific_inputs_from_database(
         scenario_id, subscenarios, subproblem, stage, conn)
 
-    # If specified_generation_period_params.tab file already exists, append
-    # rows to it
-    if os.path.isfile(os.path.join(scenario_directory, str(subproblem), str(stage), "inputs",
-                                   "specified_generation_period_params.tab")
-                      ):
-        with open(os.path.join(scenario_directory, str(subproblem), str(stage), "inputs",
-                               "specified_generation_period_params.tab"),
-                  "a") as existing_project_capacity_tab_file:
-            writer = csv.writer(existing_project_capacity_tab_file,
-                                delimiter="\t", lineterminator="\n")
-            for row in ep_capacities:
-                writer.writerow(row)
-    # If specified_generation_period_params.tab file does not exist,
-    # write header first, then add input data
-    else:
-        with open(os.path.join(scenario_directory, str(subproblem), str(stage), "inputs",
-                               "specified_generation_period_params.tab"),
-                  "w", newline="") as existing_project_capacity_tab_file:
-            writer = csv.writer(existing_project_capacity_tab_file,
-                                delimiter="\t", lineterminator="\n")
-
-            # Write header
+    inputs_dir = os.path.join(
+        scenario_directory, str(subproblem), str(stage), "inputs"
+    )
+    params_file = os.path.join(
+        inputs_dir, "specified_generation_period_params.tab"
+    )
+
+    # Append rows to specified_generation_period_params.tab file if it
+    # already exists; if it does not exist (i.e. we're at the start of the
+    # file), write the header first
+    with open(params_file, "a", newline="") as project_capacity_tab_file:
+        writer = csv.writer(project_capacity_tab_file,
+                            delimiter="\t", lineterminator="\n")
+
+        if project_capacity_tab_file.tell() == 0:
             writer.writerow(
                 ["project", "period", "specified_capacity_mw",
                  "fixed_cost_per_mw_yr"]
             )
 
-            # Write input data
-            for row in ep_capacities:
-                writer.writerow(row)
+        writer.writerows(ep_capacities)
 
 
 # Validation
@@ -17,10 +17,43 @@
 """
 
 import csv
+from functools import lru_cache
 import os.path
 import pandas as pd
 
 
+def read_projects_tab(scenario_directory, subproblem, stage):
+    """
+    :param scenario_directory:
+    :param subproblem:
+    :param stage:
+    :return: DataFrame with the contents of the projects.tab input file
+
+    Many modules need a few columns of projects.tab when loading data, so
+    the parsed file is cached and each caller gets its own copy. The cache
+    is keyed on the file's modification time and size, so it is
+    invalidated if the file is rewritten. A rewrite that keeps the same
+    size and lands within the same modification time tick of the file
+    system is not detected, and the previous contents are returned.
+    """
+    projects_file = os.path.join(
+        scenario_directory, str(subproblem), str(stage), "inputs",
+        "projects.tab"
+    )
+    file_stat = os.stat(projects_file)
+
+    return _read_projects_tab(
+        projects_file, file_stat.st_mtime_ns, file_stat.st_size
+    ).copy()
+
+
+# We only load data for one subproblem/stage at a time, so only need to
+# remember the last file read
+@lru_cache(maxsize=1)
+def _read_projects_tab(projects_file, mtime_ns, size):
+    return pd.read_csv(projects_file, sep="\t")
+
+
 # TODO: use this in capacity and operational type project subset
 #  determinations
 def determine_project_subset(
@@ -38,12 +71,9 @@ def determine_project_subset(
 
     project_subset = list()
 
-    dynamic_components = \
-        pd.read_csv(
-            os.path.join(scenario_directory, str(subproblem), str(stage),
-                         "inputs", "projects.tab"),
-            sep="\t", usecols=["project", column]
-        )
+    dynamic_components = read_projects_tab(
+        scenario_directory, subproblem, stage
+    )
 
     for row in zip(dynamic_components["project"],
                    dynamic_components[column]):
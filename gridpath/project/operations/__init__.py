@@ -48,7 +48,8 @@ from gridpath.auxiliary.dynamic_components import headroom_variables, \
 from gridpath.auxiliary.validations import write_validation_to_database, \
     validate_values, get_expected_dtypes, validate_dtypes, \
     validate_piecewise_curves, validate_startup_shutdown_rate_inputs
-from gridpath.project.common_functions import append_to_input_file
+from gridpath.project.common_functions import append_to_input_file, \
+    read_projects_tab
 
 
 def add_model_components(m, d, scenario_directory, subproblem, stage):
@@ -454,11 +455,7 @@ def record_dynamic_components(d, scenario_directory, subproblem, stage):
     'footroom_variables' dictionary.
     """
 
-    project_df = pd.read_csv(
-        os.path.join(scenario_directory, str(subproblem), str(stage), "inputs",
-                     "projects.tab"),
-        sep="\t"
-    )
+    project_df = read_projects_tab(scenario_directory, subproblem, stage)
 
     # Reserve variables
     # Will be determined based on whether the user has specified the
@@ -488,84 +485,66 @@ def load_model_data(m, d, data_portal, scenario_directory, subproblem, stage):
     :param stage:
     :return:
     """
-    data_portal.load(
-        filename=os.path.join(scenario_directory, str(subproblem), str(stage),
-                              "inputs", "projects.tab"),
-        select=("project", "variable_om_cost_per_mwh", "fuel",
-                "startup_fuel_mmbtu_per_mw", "startup_cost_per_mw",
-                "shutdown_cost_per_mw",
-                "ramp_up_violation_penalty",
-                "ramp_down_violation_penalty",
-                "min_up_time_violation_penalty",
-                "min_down_time_violation_penalty",
-                "curtailment_cost_per_pwh"),
-        param=(m.variable_om_cost_per_mwh, m.fuel,
-               m.startup_fuel_mmbtu_per_mw, m.startup_cost_per_mw,
-               m.shutdown_cost_per_mw,
-               m.ramp_up_violation_penalty,
-               m.ramp_down_violation_penalty,
-               m.min_up_time_violation_penalty,
-               m.min_down_time_violation_penalty,
-               m.curtailment_cost_per_pwh)
-    )
-
-    data_portal.data()['VAR_OM_COST_SIMPLE_PRJS'] = {
-        None: list(data_portal.data()['variable_om_cost_per_mwh'].keys())
-    }
-
-    data_portal.data()['FUEL_PRJS'] = {
-        None: list(data_portal.data()['fuel'].keys())
-    }
-
-    data_portal.data()['STARTUP_FUEL_PRJS'] = {
-        None: list(data_portal.data()['startup_fuel_mmbtu_per_mw'].keys())
-    }
-
-    data_portal.data()['STARTUP_COST_SIMPLE_PRJS'] = {
-        None: list(data_portal.data()['startup_cost_per_mw'].keys())
-    }
-
-    data_portal.data()['SHUTDOWN_COST_PRJS'] = {
-        None: list(data_portal.data()['shutdown_cost_per_mw'].keys())
-    }
-
-    data_portal.data()['RAMP_UP_VIOL_PRJS'] = {
-        None: list(data_portal.data()['ramp_up_violation_penalty'].keys())
-    }
-
-    data_portal.data()['RAMP_DOWN_VIOL_PRJS'] = {
-        None: list(data_portal.data()['ramp_down_violation_penalty'].keys())
-    }
-
-    data_portal.data()['MIN_UP_TIME_VIOL_PRJS'] = {
-        None: list(data_portal.data()['min_up_time_violation_penalty'].keys())
-    }
+    projects_df = read_projects_tab(scenario_directory, subproblem, stage)
+
+    # Optional params and the project sets over which they are defined;
+    # projects with a "." in the respective projects.tab column don't have
+    # the param specified and are not included in the set
+    optional_params_and_sets = [
+        ("variable_om_cost_per_mwh", "VAR_OM_COST_SIMPLE_PRJS"),
+        ("fuel", "FUEL_PRJS"),
+        ("startup_fuel_mmbtu_per_mw", "STARTUP_FUEL_PRJS"),
+        ("startup_cost_per_mw", "STARTUP_COST_SIMPLE_PRJS"),
+        ("shutdown_cost_per_mw", "SHUTDOWN_COST_PRJS"),
+        ("ramp_up_violation_penalty", "RAMP_UP_VIOL_PRJS"),
+        ("ramp_down_violation_penalty", "RAMP_DOWN_VIOL_PRJS"),
+        ("min_up_time_violation_penalty", "MIN_UP_TIME_VIOL_PRJS"),
+        ("min_down_time_violation_penalty", "MIN_DOWN_TIME_VIOL_PRJS"),
+        ("curtailment_cost_per_pwh", "CURTAILMENT_COST_PRJS")
+    ]
 
-    data_portal.data()['MIN_DOWN_TIME_VIOL_PRJS'] = {
-        None: list(data_portal.data()['min_down_time_violation_penalty'].keys()
-                   )
-    }
+    for param, project_set in optional_params_and_sets:
+        param_values = projects_df.loc[
+            projects_df[param] != ".", ["project", param]
+        ].set_index("project")[param]
+        if param != "fuel":
+            param_values = pd.to_numeric(param_values)
 
-    data_portal.data()['CURTAILMENT_COST_PRJS'] = {
-        None: list(data_portal.data()['curtailment_cost_per_pwh'].keys()
-                   )
-    }
+        data_portal.data()[param] = param_values.to_dict()
+        data_portal.data()[project_set] = {None: param_values.index.tolist()}
 
-    # VOM curves
+    # Curve inputs
     vom_curves_file = os.path.join(
         scenario_directory, str(subproblem), str(stage),
         "inputs", "variable_om_curves.tab"
     )
-    periods_file = os.path.join(
+    hr_curves_file = os.path.join(
         scenario_directory, str(subproblem), str(stage),
-        "inputs", "periods.tab"
+        "inputs", "heat_rate_curves.tab"
     )
 
-    if os.path.exists(vom_curves_file):
-        periods = pd.read_csv(periods_file, sep="\t")
+    load_vom_curves = os.path.exists(vom_curves_file)
+    # Get column names as a few columns will be optional;
+    # won't load data if fuel column does not exist
+    load_hr_curves = \
+        os.path.exists(hr_curves_file) and "fuel" in projects_df.columns
+
+    # The modeling periods (only the period column is needed to expand
+    # period-0 curve inputs to all periods)
+    if load_vom_curves or load_hr_curves:
+        periods = set(
+            pd.read_csv(
+                os.path.join(scenario_directory, str(subproblem), str(stage),
+                             "inputs", "periods.tab"),
+                sep="\t",
+                usecols=["period"]
+            )["period"]
+        )
+
+    # VOM curves
+    if load_vom_curves:
         vom_df = pd.read_csv(vom_curves_file, sep="\t")
 
-        periods = set(periods["period"])
         vom_projects = set(vom_df["project"].unique())
 
         slope_dict, intercept_dict = \
@@ -591,56 +570,42 @@ def load_model_data(m, d, data_portal, scenario_directory, subproblem, stage):
     if os.path.exists(startup_chars_file):
         df = pd.read_csv(startup_chars_file, sep="\t")
 
+        startup_ramp_projects_types = list()
+        startup_cost_dict = dict()
+
         # Note: the rank function requires at least one numeric input in the
         # down_time_cutoff_hours column (can't be all NULL/None).
         if len(df) > 0:
-            df["startup_type_id"] = df.groupby("project")[
+            startup_type_ids = df.groupby("project")[
                 "down_time_cutoff_hours"].rank()
 
-        startup_ramp_projects_types = list()
-        startup_cost_dict = dict()
-        for i, row in df.iterrows():
-            project = row["project"]
-            startup_type_id = row["startup_type_id"]
-            startup_cost = row["startup_cost_per_mw"]
-
-            startup_ramp_projects_types.append((project, startup_type_id))
-            startup_cost_dict[(project, startup_type_id)] = \
-                float(startup_cost)
+            startup_ramp_projects_types = list(
+                zip(df["project"].tolist(), startup_type_ids.tolist())
+            )
+            startup_cost_dict = dict(
+                zip(startup_ramp_projects_types,
+                    df["startup_cost_per_mw"].astype(float).tolist())
+            )
 
         data_portal.data()["STARTUP_BY_ST_PRJS_TYPES"] = \
             {None: startup_ramp_projects_types}
         data_portal.data()["startup_cost_by_st_per_mw"] = startup_cost_dict
         
     # HR curves
-    hr_curves_file = os.path.join(
-        scenario_directory, str(subproblem), str(stage),
-        "inputs", "heat_rate_curves.tab"
-    )
-    periods_file = os.path.join(
-        scenario_directory, str(subproblem), str(stage),
-        "inputs", "periods.tab"
-    )
-    projects_file = os.path.join(
-        scenario_directory, str(subproblem), str(stage),
-        "inputs", "projects.tab"
-    )
-
-    # Get column names as a few columns will be optional;
-    # won't load data if fuel column does not exist
-    headers = pd.read_csv(projects_file, nrows=0, sep="\t").columns
-    if os.path.exists(hr_curves_file) and "fuel" in headers:
+    if load_hr_curves:
 
         hr_df = pd.read_csv(hr_curves_file, sep="\t")
         projects = set(hr_df["project"].unique())
-        
-        periods_df = pd.read_csv(periods_file, sep="\t")
-        pr_df = pd.read_csv(projects_file, sep="\t", usecols=["project", "fuel"])
+
+        pr_df = projects_df[["project", "fuel"]]
         pr_df = pr_df[(pr_df["fuel"] != ".") & (pr_df["project"].isin(projects))]
 
-        periods = set(periods_df["period"])
         fuel_projects = pr_df["project"].unique()
 
+        # Only keep the curve inputs of fuel projects before sorting and
+        # splitting them by project
+        hr_df = hr_df[hr_df["project"].isin(fuel_projects)]
+
         slope_dict, intercept_dict = \
             get_slopes_intercept_by_project_period_segment(
                 hr_df, "average_heat_rate_mmbtu_per_mwh",
@@ -664,7 +629,8 @@ def get_inputs_from_database(scenario_id, subscenarios, subproblem, stage, conn)
     :param subproblem:
     :param stage:
     :param conn: database connection
-    :return:
+    :return: cursor with the operational characteristics and DataFrames
+        with the heat rate curves, variable O&M curves, and startup chars
     """
     subproblem = 1 if subproblem == "" else subproblem
     stage = 1 if stage == "" else stage
@@ -692,22 +658,20 @@ def get_inputs_from_database(scenario_id, subscenarios, subproblem, stage, conn)
         FROM
         (SELECT project, capacity_type
         FROM inputs_project_portfolios
-        WHERE project_portfolio_scenario_id = {}) as portfolio_tbl
+        WHERE project_portfolio_scenario_id = ?) as portfolio_tbl
         LEFT OUTER JOIN
         -- Select the operational characteristics based on the 
         -- project_operational_chars_scenario_id
         inputs_project_operational_chars
         USING (project)
-        WHERE project_operational_chars_scenario_id = {}
+        WHERE project_operational_chars_scenario_id = ?
         ;
-        """.format(
-            subscenarios.PROJECT_PORTFOLIO_SCENARIO_ID,
-            subscenarios.PROJECT_OPERATIONAL_CHARS_SCENARIO_ID,
-        )
+        """,
+        (subscenarios.PROJECT_PORTFOLIO_SCENARIO_ID,
+         subscenarios.PROJECT_OPERATIONAL_CHARS_SCENARIO_ID)
     )
 
-    c2 = conn.cursor()
-    heat_rates = c2.execute(
+    heat_rates = pd.read_sql_query(
         """
         SELECT project, period,
         load_point_fraction, average_heat_rate_mmbtu_per_mwh
@@ -716,7 +680,7 @@ def get_inputs_from_database(scenario_id, subscenarios, subproblem, stage, conn)
         INNER JOIN
         (SELECT project, heat_rate_curves_scenario_id
         FROM inputs_project_operational_chars
-        WHERE project_operational_chars_scenario_id = {}
+        WHERE project_operational_chars_scenario_id = ?
         ) AS op_char
         USING(project)
         -- select only heat curves of matching projects
@@ -725,13 +689,14 @@ def get_inputs_from_database(scenario_id, subscenarios, subproblem, stage, conn)
         USING(project, heat_rate_curves_scenario_id)
         -- Get only the subset of projects in the portfolio based on the 
         -- project_portfolio_scenario_id 
-        WHERE project_portfolio_scenario_id = {}
-        """.format(subscenarios.PROJECT_OPERATIONAL_CHARS_SCENARIO_ID,
-                   subscenarios.PROJECT_PORTFOLIO_SCENARIO_ID)
+        WHERE project_portfolio_scenario_id = ?
+        """,
+        conn,
+        params=(subscenarios.PROJECT_OPERATIONAL_CHARS_SCENARIO_ID,
+                subscenarios.PROJECT_PORTFOLIO_SCENARIO_ID)
     )
 
-    c3 = conn.cursor()
-    vom_curves = c3.execute(
+    vom_curves = pd.read_sql_query(
         """
         SELECT project, period,  
         load_point_fraction, average_variable_om_cost_per_mwh
@@ -740,23 +705,24 @@ def get_inputs_from_database(scenario_id, subscenarios, subproblem, stage, conn)
         INNER JOIN
         (SELECT project, variable_om_curves_scenario_id
         FROM inputs_project_operational_chars
-        WHERE project_operational_chars_scenario_id = {}
+        WHERE project_operational_chars_scenario_id = ?
         ) AS op_char
         USING(project)
         -- select only variable OM curves inputs with matching projects
         INNER JOIN
         inputs_project_variable_om_curves
         USING(project, variable_om_curves_scenario_id)
-        WHERE project_portfolio_scenario_id = {}
+        WHERE project_portfolio_scenario_id = ?
         -- Get only the subset of projects in the portfolio based on the 
         -- project_portfolio_scenario_id 
         AND variable_om_curves_scenario_id is not Null
-        """.format(subscenarios.PROJECT_OPERATIONAL_CHARS_SCENARIO_ID,
-                   subscenarios.PROJECT_PORTFOLIO_SCENARIO_ID)
+        """,
+        conn,
+        params=(subscenarios.PROJECT_OPERATIONAL_CHARS_SCENARIO_ID,
+                subscenarios.PROJECT_PORTFOLIO_SCENARIO_ID)
     )
 
-    c4 = conn.cursor()
-    startup_chars = c4.execute(
+    startup_chars = pd.read_sql_query(
         """
         SELECT project, 
         down_time_cutoff_hours, startup_plus_ramp_up_rate, startup_cost_per_mw
@@ -764,16 +730,18 @@ def get_inputs_from_database(scenario_id, subscenarios, subproblem, stage, conn)
         INNER JOIN
         (SELECT project, startup_chars_scenario_id
         FROM inputs_project_operational_chars
-        WHERE project_operational_chars_scenario_id = {}
+        WHERE project_operational_chars_scenario_id = ?
         ) AS op_char
         USING(project)
         INNER JOIN
         inputs_project_startup_chars
         USING(project, startup_chars_scenario_id)
-        WHERE project_portfolio_scenario_id = {}
+        WHERE project_portfolio_scenario_id = ?
         AND startup_chars_scenario_id is not Null
-        """.format(subscenarios.PROJECT_OPERATIONAL_CHARS_SCENARIO_ID,
-                   subscenarios.PROJECT_PORTFOLIO_SCENARIO_ID)
+        """,
+        conn,
+        params=(subscenarios.PROJECT_OPERATIONAL_CHARS_SCENARIO_ID,
+                subscenarios.PROJECT_PORTFOLIO_SCENARIO_ID)
     )
 
     return proj_opchar, heat_rates, vom_curves, startup_chars
@@ -789,7 +757,7 @@ def write_model_inputs(scenario_directory, scenario_id, subscenarios, subproblem
     :param conn: database connection
     :return:
     """
-    proj_opchar, heat_rate_curves, vom_curves, startup_chars = \
+    proj_opchar, hr_df, vom_df, su_df = \
         get_inputs_from_database(scenario_id, subscenarios, subproblem, stage, conn)
 
     # Update the projects.tab file
@@ -824,7 +792,6 @@ def write_model_inputs(scenario_directory, scenario_id, subscenarios, subproblem
     )
 
     # Write heat rates file
-    hr_df = cursor_to_df(heat_rate_curves)
     if not hr_df.empty:
         hr_df = hr_df.fillna(".")
         fpath = os.path.join(scenario_directory, str(subproblem), str(stage),
@@ -833,7 +800,6 @@ def write_model_inputs(scenario_directory, scenario_id, subscenarios, subproblem
         hr_df.to_csv(fpath, index=False, sep="\t")
 
     # Write VOM file
-    vom_df = cursor_to_df(vom_curves)
     if not vom_df.empty:
         vom_df = vom_df.fillna(".")
         fpath = os.path.join(scenario_directory, str(subproblem), str(stage),
@@ -841,7 +807,6 @@ def write_model_inputs(scenario_directory, scenario_id, subscenarios, subproblem
         vom_df.to_csv(fpath, index=False, sep="\t")
 
     # Write startup chars file
-    su_df = cursor_to_df(startup_chars)
     if not su_df.empty:
         su_df = su_df.fillna(".")
         fpath = os.path.join(scenario_directory, str(subproblem), str(stage),
@@ -863,7 +828,7 @@ def validate_inputs(scenario_id, subscenarios, subproblem, stage, conn):
     """
 
     # Get the project input data
-    proj_opchar, heat_rates, vom_curves, startup_chars = \
+    proj_opchar, hr_df, vom_df, su_df = \
         get_inputs_from_database(scenario_id, subscenarios, subproblem, stage, conn)
 
     # Convert input data into DataFrame
@@ -915,9 +880,6 @@ def validate_inputs(scenario_id, subscenarios, subproblem, stage, conn):
                                    min=0, max=1, strict_min=True)
         )
 
-    # Convert input data into DataFrame
-    hr_df = cursor_to_df(heat_rates)
-
     # Check data types heat_rates:
     expected_dtypes = get_expected_dtypes(
         conn, ["inputs_project_heat_rate_curves"]
@@ -991,8 +953,6 @@ def validate_inputs(scenario_id, subscenarios, subproblem, stage, conn):
     )
 
     # Validate VOM curves
-    vom_df = cursor_to_df(vom_curves)
-
     # Check data types
     expected_dtypes = get_expected_dtypes(
         conn, ["inputs_project_variable_om_curves"]
@@ -1041,9 +1001,6 @@ def validate_inputs(scenario_id, subscenarios, subproblem, stage, conn):
     )
 
     # Validate startup chars
-    # Convert input data to DataFrame
-    su_df = cursor_to_df(startup_chars)
-
     # Get the number of hours in the timepoint (take min if it varies)
     c = conn.cursor()
     tmp_durations = c.execute(
@@ -1144,8 +1101,14 @@ def get_slopes_intercept_by_project_period_segment(
     slope_dict = {}
     intercept_dict = {}
 
+    # Sort the inputs by project, period, and load point and split them by
+    # project; projects without inputs get an empty slice
+    df = df.sort_values(by=["project", "period", "load_point_fraction"])
+    df_by_project = dict(list(df.groupby("project", sort=False)))
+    no_inputs = df.iloc[0:0]
+
     for project in projects:
-        df_slice = df[df["project"] == project]
+        df_slice = df_by_project.get(project, no_inputs)
         slice_periods = set(df_slice["period"])
 
         if slice_periods == set([0]):
@@ -1162,37 +1125,22 @@ def get_slopes_intercept_by_project_period_segment(
 
         for period in p_iterable:
             df_slice_p = df_slice[df_slice["period"] == period]
-            df_slice_p = df_slice_p.sort_values(by=["load_point_fraction"])
             load_points = df_slice_p["load_point_fraction"].values
             averages = df_slice_p[input_col].values
 
             slopes, intercepts = calculate_slope_intercept(
                 project, load_points, averages
             )
-            sgms = range(len(slopes))
-
-            # If period is 0, create same inputs for all periods
-            if period == 0:
-                slope_dict.update(
-                    {(project, p, sgms[i]): slope
-                     for i, slope in enumerate(slopes)
-                     for p in periods}
-                )
-                intercept_dict.update(
-                    {(project, p, sgms[i]): intercept
-                     for i, intercept in enumerate(intercepts)
-                     for p in periods}
-                )
-            # If not, create inputs for just this period
-            else:
-                slope_dict.update(
-                    {(project, period, sgms[i]): slope
-                     for i, slope in enumerate(slopes)}
-                )
-                intercept_dict.update(
-                    {(project, period, sgms[i]): intercept
-                     for i, intercept in enumerate(intercepts)}
-                )
+            # Native Python floats for the data portal
+            slopes = slopes.tolist()
+            intercepts = intercepts.tolist()
+
+            # If period is 0, create same inputs for all periods; if not,
+            # create inputs for just this period
+            for p in (periods if period == 0 else [period]):
+                keys = [(project, p, sgm) for sgm in range(len(slopes))]
+                slope_dict.update(zip(keys, slopes))
+                intercept_dict.update(zip(keys, intercepts))
 
     return slope_dict, intercept_dict
 
@@ -14,3 +14,62 @@ def load_operational_type_modules(required_operational_modules):
         package="gridpath.project.operations.operational_types",
         required_attributes=[]
     )
+
+
+def get_prj_opr_tmps_sgms(mod, prj_prds_sgms_set):
+    """
+    Get the project-timepoint-segment combinations for a curve defined by
+    project, period, and segment: each of the project's segments in a
+    period applies to all of the project's operational timepoints in that
+    period.
+    :param mod:
+    :param prj_prds_sgms_set: str, name of the (project, period, segment)
+        set of the curve
+    :return: list of (project, timepoint, segment) tuples
+    """
+    # Segments by project and period
+    sgms_by_prj_prd = dict()
+    for (g, p, s) in getattr(mod, prj_prds_sgms_set):
+        sgms_by_prj_prd.setdefault((g, p), []).append(s)
+
+    return [
+        (g, tmp, s) for (g, tmp) in mod.PRJ_OPR_TMPS
+        for s in sgms_by_prj_prd.get((g, mod.period[tmp]), [])
+    ]
+
+
+def get_prj_opr_tmps_w_sgms(mod, prj_prds_sgms_set):
+    """
+    Get the project-timepoint combinations for which a curve defined by
+    project, period, and segment has segments, i.e. the project's
+    operational timepoints in the periods for which the curve is specified.
+    :param mod:
+    :param prj_prds_sgms_set: str, name of the (project, period, segment)
+        set of the curve
+    :return: list of (project, timepoint) tuples
+    """
+    prj_prds = frozenset(
+        (g, p) for (g, p, s) in getattr(mod, prj_prds_sgms_set)
+    )
+
+    return [
+        (g, tmp) for (g, tmp) in mod.PRJ_OPR_TMPS
+        if (g, mod.period[tmp]) in prj_prds
+    ]
+
+
+def get_prj_tmps_subset(mod, prj_set, prj_tmps_set="PRJ_OPR_TMPS"):
+    """
+    Get the project-timepoint combinations in a project-timepoint set that
+    belong to the projects in a project subset.
+    :param mod:
+    :param prj_set: str, name of the project subset
+    :param prj_tmps_set: str, name of the project-timepoint set to filter
+    :return: list of (project, timepoint) tuples
+    """
+    # Projects in the subset, for membership checks
+    prjs = frozenset(getattr(mod, prj_set))
+
+    return [
+        (g, tmp) for (g, tmp) in getattr(mod, prj_tmps_set) if g in prjs
+    ]
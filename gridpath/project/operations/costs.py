@@ -30,7 +30,8 @@ from pyomo.environ import Set, Var, Expression, Constraint, \
 from db.common_functions import spin_on_database_lock
 from gridpath.auxiliary.auxiliary import get_required_subtype_modules_from_projects_file
 from gridpath.project.operations.common_functions import \
-    load_operational_type_modules
+    load_operational_type_modules, get_prj_opr_tmps_sgms, \
+    get_prj_opr_tmps_w_sgms, get_prj_tmps_subset
 from gridpath.auxiliary.db_interface import setup_results_import
 import gridpath.project.operations.operational_types as op_type
 
@@ -192,63 +193,58 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
     m.VAR_OM_COST_SIMPLE_PRJ_OPR_TMPS = Set(
         dimen=2,
         within=m.PRJ_OPR_TMPS,
-        initialize=lambda mod: [(p, tmp) for (p, tmp) in mod.PRJ_OPR_TMPS
-                          if p in mod.VAR_OM_COST_SIMPLE_PRJS]
+        initialize=lambda mod:
+        get_prj_tmps_subset(mod, "VAR_OM_COST_SIMPLE_PRJS")
     )
 
     m.VAR_OM_COST_CURVE_PRJS_OPR_TMPS_SGMS = Set(
         dimen=3,
-        initialize=lambda mod: list(
-            set((g, tmp, s) for (g, tmp) in mod.PRJ_OPR_TMPS
-                for _g, p, s in mod.VAR_OM_COST_CURVE_PRJS_PRDS_SGMS
-                if g == _g and mod.period[tmp] == p)
-        )
+        initialize=lambda mod:
+        get_prj_opr_tmps_sgms(mod, "VAR_OM_COST_CURVE_PRJS_PRDS_SGMS")
     )
 
     m.VAR_OM_COST_CURVE_PRJS_OPR_TMPS = Set(
         dimen=2,
         within=m.PRJ_OPR_TMPS,
-        initialize=lambda mod: list(
-            set((g, tmp) for (g, tmp, s)
-                in mod.VAR_OM_COST_CURVE_PRJS_OPR_TMPS_SGMS)
-        )
+        initialize=lambda mod:
+        get_prj_opr_tmps_w_sgms(mod, "VAR_OM_COST_CURVE_PRJS_PRDS_SGMS")
     )
 
     # All VOM projects
     m.VAR_OM_COST_ALL_PRJS_OPR_TMPS = Set(
         within=m.PRJ_OPR_TMPS,
         initialize=lambda mod: list(
-            set(mod.VAR_OM_COST_SIMPLE_PRJ_OPR_TMPS
-                | mod.VAR_OM_COST_CURVE_PRJS_OPR_TMPS)
+            mod.VAR_OM_COST_SIMPLE_PRJ_OPR_TMPS
+            | mod.VAR_OM_COST_CURVE_PRJS_OPR_TMPS
         )
     )
 
     m.STARTUP_COST_PRJ_OPR_TMPS = Set(
         dimen=2,
         within=m.PRJ_OPR_TMPS,
-        initialize=lambda mod: [(p, tmp) for (p, tmp) in mod.PRJ_OPR_TMPS
-                          if p in mod.STARTUP_COST_PRJS]
+        initialize=lambda mod:
+        get_prj_tmps_subset(mod, "STARTUP_COST_PRJS")
     )
 
     m.SHUTDOWN_COST_PRJ_OPR_TMPS = Set(
         dimen=2,
         within=m.PRJ_OPR_TMPS,
-        initialize=lambda mod: [(p, tmp) for (p, tmp) in mod.PRJ_OPR_TMPS
-                          if p in mod.SHUTDOWN_COST_PRJS]
+        initialize=lambda mod:
+        get_prj_tmps_subset(mod, "SHUTDOWN_COST_PRJS")
     )
 
     m.VIOL_ALL_PRJ_OPR_TMPS = Set(
         dimen=2,
         within=m.PRJ_OPR_TMPS,
-        initialize=lambda mod: [(p, tmp) for (p, tmp) in mod.PRJ_OPR_TMPS
-                          if p in mod.VIOL_ALL_PRJS]
+        initialize=lambda mod:
+        get_prj_tmps_subset(mod, "VIOL_ALL_PRJS")
     )
 
     m.CURTAILMENT_COST_PRJ_OPR_TMPS = Set(
         dimen=2,
         within=m.PRJ_OPR_TMPS,
-        initialize=lambda mod: [(p, tmp) for (p, tmp) in mod.PRJ_OPR_TMPS
-                          if p in mod.CURTAILMENT_COST_PRJS]
+        initialize=lambda mod:
+        get_prj_tmps_subset(mod, "CURTAILMENT_COST_PRJS")
     )
 
     # Variables
@@ -27,7 +27,8 @@ from db.common_functions import spin_on_database_lock
 from gridpath.auxiliary.db_interface import setup_results_import
 from gridpath.auxiliary.auxiliary import get_required_subtype_modules_from_projects_file
 from gridpath.project.operations.common_functions import \
-    load_operational_type_modules
+    load_operational_type_modules, get_prj_opr_tmps_sgms, \
+    get_prj_opr_tmps_w_sgms, get_prj_tmps_subset
 import gridpath.project.operations.operational_types as op_type
 
 
@@ -137,31 +138,28 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
     m.FUEL_PRJ_OPR_TMPS = Set(
         dimen=2,
         within=m.PRJ_OPR_TMPS,
-        initialize=lambda mod: [(p, tmp) for (p, tmp) in mod.PRJ_OPR_TMPS
-                          if p in mod.FUEL_PRJS]
+        initialize=lambda mod:
+        get_prj_tmps_subset(mod, "FUEL_PRJS")
     )
 
     m.HR_CURVE_PRJS_OPR_TMPS_SGMS = Set(
         dimen=3,
         initialize=lambda mod:
-        set((g, tmp, s) for (g, tmp) in mod.PRJ_OPR_TMPS
-            for _g, p, s in mod.HR_CURVE_PRJS_PRDS_SGMS
-            if g == _g and mod.period[tmp] == p)
+        get_prj_opr_tmps_sgms(mod, "HR_CURVE_PRJS_PRDS_SGMS")
     )
 
     m.HR_CURVE_PRJS_OPR_TMPS = Set(
         dimen=2,
         within=m.FUEL_PRJ_OPR_TMPS,
         initialize=lambda mod:
-        set((g, tmp)
-            for (g, tmp, s) in mod.HR_CURVE_PRJS_OPR_TMPS_SGMS)
+        get_prj_opr_tmps_w_sgms(mod, "HR_CURVE_PRJS_PRDS_SGMS")
     )
 
     m.STARTUP_FUEL_PRJ_OPR_TMPS = Set(
         dimen=2,
         within=m.FUEL_PRJ_OPR_TMPS,
-        initialize=lambda mod: [(p, tmp) for (p, tmp) in mod.FUEL_PRJ_OPR_TMPS
-                          if p in mod.STARTUP_FUEL_PRJS]
+        initialize=lambda mod:
+        get_prj_tmps_subset(mod, "STARTUP_FUEL_PRJS", "FUEL_PRJ_OPR_TMPS")
     )
 
     # Variables
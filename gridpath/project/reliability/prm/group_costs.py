@@ -13,11 +13,10 @@
 # limitations under the License.
 
 
-import os.path
-import pandas as pd
 from pyomo.environ import Set, Expression, Param
 
 from gridpath.auxiliary.auxiliary import join_sets
+from gridpath.project.common_functions import read_projects_tab
 from gridpath.project.reliability.prm.common_functions import \
     load_prm_type_modules
 from gridpath.auxiliary.dynamic_components import prm_cost_group_sets, \
@@ -37,30 +36,27 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
             join_sets(mod, getattr(d, prm_cost_group_sets))
             )
 
-    def group_prm_type_init(mod, group):
+    def group_prm_type_init(mod):
         """
         Figure out the PRM type of each group
         :param mod:
-        :param group:
-        :return:
+        :return: dictionary with the PRM type of each group
         """
+        group_prm_types = dict()
         for group_set in getattr(d, prm_cost_group_sets):
+            prm_type = getattr(d, prm_cost_group_prm_type)[group_set]
             for element in getattr(mod, group_set):
-                if element == group:
-                    return getattr(d, prm_cost_group_prm_type)[group_set]
+                group_prm_types.setdefault(element, prm_type)
+
+        return group_prm_types
 
     m.group_prm_type = Param(
         m.PRM_COST_GROUPS, within=["energy_only_allowed"],
-        initialize=lambda mod, g: group_prm_type_init(mod, g)
+        initialize=group_prm_type_init
     )
 
     # Import all possible PRM modules
-    project_df = pd.read_csv(
-        os.path.join(scenario_directory, str(subproblem), str(stage),
-                     "inputs", "projects.tab"),
-        sep="\t",
-        usecols=["project", "prm_type"]
-    )
+    project_df = read_projects_tab(scenario_directory, subproblem, stage)
     required_prm_modules = [
         prm_type for prm_type in project_df.prm_type.unique() if
         prm_type != "."
@@ -97,6 +97,8 @@ def generic_export_results(scenario_directory, subproblem, stage, m, d,
     :param reserve_violation_expression:
     :return:
     """
+    reserve_violation = getattr(m, reserve_violation_expression)
+
     with open(os.path.join(scenario_directory, str(subproblem), str(stage), "results",
                            filename), "w", newline="") \
             as results_file:
@@ -106,18 +108,17 @@ def generic_export_results(scenario_directory, subproblem, stage, m, d,
                          "timepoint_weight", "number_of_hours_in_timepoint",
                          column_name]
                         )
-        for (ba, tmp) in getattr(m, reserve_zone_set) * m.TMPS:
-            writer.writerow([
-                ba,
-                m.period[tmp],
-                tmp,
-                m.discount_factor[m.period[tmp]],
-                m.number_years_represented[m.period[tmp]],
-                m.tmp_weight[tmp],
-                m.hrs_in_tmp[tmp],
-                value(getattr(m, reserve_violation_expression)[ba, tmp])
-            ]
-            )
+        writer.writerows(
+            [ba,
+             m.period[tmp],
+             tmp,
+             m.discount_factor[m.period[tmp]],
+             m.number_years_represented[m.period[tmp]],
+             m.tmp_weight[tmp],
+             m.hrs_in_tmp[tmp],
+             value(reserve_violation[ba, tmp])]
+            for (ba, tmp) in getattr(m, reserve_zone_set) * m.TMPS
+        )
 
 
 def generic_save_duals(m, reserve_constraint_name):
@@ -12,10 +12,40 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from functools import lru_cache
+from importlib import import_module
+import sys
+
 from pyomo.environ import AbstractModel, DataPortal
 from gridpath.auxiliary.dynamic_components import DynamicComponents
 
 
+def get_prereq_modules(prereq_module_names):
+    """
+    Import the prerequisite modules of the module being tested
+    :param prereq_module_names: list of the names of the prerequisite
+        modules relative to the gridpath package
+    :return: list of the imported prerequisite modules
+    """
+    return list(_import_prereq_modules(tuple(prereq_module_names)))
+
+
+# Many test files share the same prerequisites, so only import each list of
+# prerequisite modules once per test session
+@lru_cache(maxsize=None)
+def _import_prereq_modules(prereq_module_names):
+    imported_prereq_modules = list()
+    for mdl in prereq_module_names:
+        try:
+            imported_module = import_module("." + str(mdl), package="gridpath")
+            imported_prereq_modules.append(imported_module)
+        except ImportError:
+            print("ERROR! Module " + str(mdl) + " not found.")
+            sys.exit(1)
+
+    return tuple(imported_prereq_modules)
+
+
 def determine_dynamic_components(prereq_modules, module_to_test, test_data_dir,
                                  subproblem, stage):
     """
@@ -95,7 +95,7 @@ class TestCarbonCapZones(unittest.TestCase):
         expected_carbon_cap_zones = sorted(["Carbon_Cap_Zone1",
                                             "Carbon_Cap_Zone2"])
         actual_carbon_cap_zones = \
-            sorted([z for z in instance.CARBON_CAP_ZONES])
+            sorted(instance.CARBON_CAP_ZONES)
         self.assertListEqual(expected_carbon_cap_zones,
                              actual_carbon_cap_zones)
 
@@ -79,7 +79,7 @@ class TestLoadFollowingUpBAs(unittest.TestCase):
 
         # Balancing areas
         expected = sorted(["Zone1", "Zone2"])
-        actual = sorted([z for z in instance.FREQUENCY_RESPONSE_BAS])
+        actual = sorted(instance.FREQUENCY_RESPONSE_BAS)
         self.assertListEqual(expected, actual,
                              msg="FREQUENCY_RESPONSE_BAS set data does not "
                                  "load correctly."
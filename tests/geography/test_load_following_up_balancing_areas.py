@@ -76,7 +76,7 @@ class TestLoadFollowingUpBAs(unittest.TestCase):
                                          stage="")
         instance = m.create_instance(data)
         expected = sorted(["Zone1", "Zone2"])
-        actual = sorted([z for z in instance.LF_RESERVES_UP_ZONES])
+        actual = sorted(instance.LF_RESERVES_UP_ZONES)
         self.assertListEqual(expected, actual,
                              msg="LF_RESERVES_UP_ZONES set data does not "
                                  "load correctly."
@@ -95,6 +95,6 @@ class TestLocalCapacityZones(unittest.TestCase):
             "Local_Capacity_Zone1", "Local_Capacity_Zone2"
         ])
         actual_local_capacity_zones = \
-            sorted([z for z in instance.LOCAL_CAPACITY_ZONES])
+            sorted(instance.LOCAL_CAPACITY_ZONES)
         self.assertListEqual(expected_local_capacity_zones,
                              actual_local_capacity_zones)
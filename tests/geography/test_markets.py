@@ -93,6 +93,6 @@ class TestMarkets(unittest.TestCase):
         # Set: PRM_ZONES
         expected_markets = sorted(["Market_Hub_1", "Market_Hub_2"])
         actual_markets = \
-            sorted([market for market in instance.MARKETS])
+            sorted(instance.MARKETS)
         self.assertListEqual(expected_markets,
                              actual_markets)
@@ -93,6 +93,6 @@ class TestPRMZones(unittest.TestCase):
         # Set: PRM_ZONES
         expected_prm_zones = sorted(["PRM_Zone1", "PRM_Zone2"])
         actual_prm_zones = \
-            sorted([z for z in instance.PRM_ZONES])
+            sorted(instance.PRM_ZONES)
         self.assertListEqual(expected_prm_zones,
                              actual_prm_zones)
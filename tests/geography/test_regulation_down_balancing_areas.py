@@ -79,7 +79,7 @@ class TestLoadFollowingDownBAs(unittest.TestCase):
 
         # Balancing areas
         expected = sorted(["Zone1", "Zone2"])
-        actual = sorted([z for z in instance.REGULATION_DOWN_ZONES])
+        actual = sorted(instance.REGULATION_DOWN_ZONES)
         self.assertListEqual(expected, actual,
                              msg="REGULATION_DOWN_ZONES set data does not "
                                  "load correctly."
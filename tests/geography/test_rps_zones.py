@@ -93,7 +93,7 @@ class TestRPSZones(unittest.TestCase):
 
         # Set: RPS_ZONES
         expected_rps_zones = sorted(["RPS_Zone_1", "RPS_Zone_2"])
-        actual_rps_zones = sorted([z for z in instance.RPS_ZONES])
+        actual_rps_zones = sorted(instance.RPS_ZONES)
         self.assertListEqual(expected_rps_zones, actual_rps_zones)
 
         # Param: allow_violation
@@ -79,7 +79,7 @@ class TestSpinningReservesBAs(unittest.TestCase):
 
         # Balancing areas
         expected = sorted(["Zone1", "Zone2"])
-        actual = sorted([z for z in instance.SPINNING_RESERVES_ZONES])
+        actual = sorted(instance.SPINNING_RESERVES_ZONES)
         self.assertListEqual(expected, actual,
                              msg="SPINNING_RESERVES_ZONES set data does not "
                                  "load correctly."
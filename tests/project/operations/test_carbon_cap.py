@@ -106,7 +106,7 @@ class TestCarbonEmissions(unittest.TestCase):
              "Disp_Cont_Commit", "Disp_No_Commit", "Clunky_Old_Gen",
              "Clunky_Old_Gen2"])
         actual_carbonaceous_projects = \
-            sorted([p for p in instance.CRBN_PRJS])
+            sorted(instance.CRBN_PRJS)
         self.assertListEqual(expected_carbonaceous_projects,
                              actual_carbonaceous_projects)
 
@@ -0,0 +1,160 @@
+# Copyright 2016-2020 Blue Marble Analytics LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pyomo.environ import ConcreteModel, Param, Set
+import unittest
+
+import gridpath.project.operations.common_functions as \
+    operations_module_to_test
+
+
+def build_test_model():
+    """
+    Build a small model with four timepoints in two periods: project A
+    has curve segments in both periods, project B has none, project C has
+    segments in one period only, and project D has segments but no
+    operational timepoints
+    """
+    mod = ConcreteModel()
+    mod.TMPS = Set(initialize=[1, 2, 3, 4])
+    mod.period = Param(
+        mod.TMPS, initialize={1: 2020, 2: 2020, 3: 2030, 4: 2030}
+    )
+    mod.PRJ_OPR_TMPS = Set(
+        dimen=2,
+        initialize=[("A", 1), ("A", 2), ("A", 3), ("A", 4),
+                    ("B", 1), ("B", 2), ("B", 3), ("B", 4),
+                    ("C", 3), ("C", 4)]
+    )
+    mod.CURVE_PRJS_PRDS_SGMS = Set(
+        dimen=3,
+        initialize=[("A", 2020, 0), ("A", 2020, 1), ("A", 2030, 0),
+                    ("C", 2030, 0), ("C", 2030, 1), ("D", 2020, 0)]
+    )
+    mod.EMPTY_PRJS_PRDS_SGMS = Set(dimen=3, initialize=[])
+    mod.SUBSET_PRJS = Set(initialize=["C", "A", "D"])
+    mod.EMPTY_PRJS = Set(initialize=[])
+
+    return mod
+
+
+class TestOperationsCommonFunctions(unittest.TestCase):
+    """
+
+    """
+    def test_get_prj_opr_tmps_sgms(self):
+        """
+        Check the project-timepoint-segments against the previous inline
+        list comprehension, including their order
+        """
+        mod = build_test_model()
+
+        expected_prj_tmps_sgms = [
+            ("A", 1, 0), ("A", 1, 1), ("A", 2, 0), ("A", 2, 1),
+            ("A", 3, 0), ("A", 4, 0),
+            ("C", 3, 0), ("C", 3, 1), ("C", 4, 0), ("C", 4, 1)
+        ]
+        actual_prj_tmps_sgms = \
+            operations_module_to_test.get_prj_opr_tmps_sgms(
+                mod, "CURVE_PRJS_PRDS_SGMS"
+            )
+        self.assertListEqual(expected_prj_tmps_sgms, actual_prj_tmps_sgms)
+
+        inline_prj_tmps_sgms = [
+            (g, tmp, s) for (g, tmp) in mod.PRJ_OPR_TMPS
+            for _g, p, s in mod.CURVE_PRJS_PRDS_SGMS
+            if g == _g and mod.period[tmp] == p
+        ]
+        self.assertListEqual(inline_prj_tmps_sgms, actual_prj_tmps_sgms)
+
+        # If no segments
+        self.assertListEqual(
+            [],
+            operations_module_to_test.get_prj_opr_tmps_sgms(
+                mod, "EMPTY_PRJS_PRDS_SGMS"
+            )
+        )
+
+    def test_get_prj_opr_tmps_w_sgms(self):
+        """
+        Check the project-timepoints with segments against the unique
+        project-timepoints of the project-timepoint-segments, including
+        their order
+        """
+        mod = build_test_model()
+
+        expected_prj_tmps = [
+            ("A", 1), ("A", 2), ("A", 3), ("A", 4), ("C", 3), ("C", 4)
+        ]
+        actual_prj_tmps = \
+            operations_module_to_test.get_prj_opr_tmps_w_sgms(
+                mod, "CURVE_PRJS_PRDS_SGMS"
+            )
+        self.assertListEqual(expected_prj_tmps, actual_prj_tmps)
+
+        inline_prj_tmps = list(dict.fromkeys(
+            (g, tmp) for (g, tmp, s) in
+            operations_module_to_test.get_prj_opr_tmps_sgms(
+                mod, "CURVE_PRJS_PRDS_SGMS"
+            )
+        ))
+        self.assertListEqual(inline_prj_tmps, actual_prj_tmps)
+
+        # If no segments
+        self.assertListEqual(
+            [],
+            operations_module_to_test.get_prj_opr_tmps_w_sgms(
+                mod, "EMPTY_PRJS_PRDS_SGMS"
+            )
+        )
+
+    def test_get_prj_tmps_subset(self):
+        """
+        Check the project-timepoint subset against the previous inline list
+        comprehension, including its order
+        """
+        mod = build_test_model()
+
+        expected_prj_tmps = [
+            ("A", 1), ("A", 2), ("A", 3), ("A", 4), ("C", 3), ("C", 4)
+        ]
+        actual_prj_tmps = operations_module_to_test.get_prj_tmps_subset(
+            mod, "SUBSET_PRJS"
+        )
+        self.assertListEqual(expected_prj_tmps, actual_prj_tmps)
+
+        inline_prj_tmps = [
+            (p, tmp) for (p, tmp) in mod.PRJ_OPR_TMPS if p in mod.SUBSET_PRJS
+        ]
+        self.assertListEqual(inline_prj_tmps, actual_prj_tmps)
+
+        # If a different project-timepoint set
+        mod.C_PRJS = Set(initialize=["C"])
+        mod.SUBSET_PRJ_OPR_TMPS = Set(dimen=2, initialize=actual_prj_tmps)
+        self.assertListEqual(
+            [("C", 3), ("C", 4)],
+            operations_module_to_test.get_prj_tmps_subset(
+                mod, "C_PRJS", "SUBSET_PRJ_OPR_TMPS"
+            )
+        )
+
+        # If the project subset is empty
+        self.assertListEqual(
+            [],
+            operations_module_to_test.get_prj_tmps_subset(mod, "EMPTY_PRJS")
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -127,7 +127,7 @@ class TestOperationsInit(unittest.TestCase):
         )
 
         actual_var_om_simple_projects = \
-            sorted([p for p in instance.VAR_OM_COST_SIMPLE_PRJS])
+            sorted(instance.VAR_OM_COST_SIMPLE_PRJS)
 
         self.assertListEqual(expected_var_om_simple_projects,
                              actual_var_om_simple_projects)
@@ -155,7 +155,7 @@ class TestOperationsInit(unittest.TestCase):
         )
 
         actual_var_om_curve_projects = \
-            sorted([p for p in instance.VAR_OM_COST_CURVE_PRJS])
+            sorted(instance.VAR_OM_COST_CURVE_PRJS)
 
         self.assertListEqual(expected_var_om_curve_projects,
                              actual_var_om_curve_projects)
@@ -166,7 +166,7 @@ class TestOperationsInit(unittest.TestCase):
         )))
 
         actual_var_om_all_projects = \
-            sorted([p for p in instance.VAR_OM_COST_ALL_PRJS])
+            sorted(instance.VAR_OM_COST_ALL_PRJS)
 
         self.assertListEqual(expected_var_om_all_projects,
                              actual_var_om_all_projects)
@@ -179,7 +179,7 @@ class TestOperationsInit(unittest.TestCase):
         )
 
         actual_startup_cost_simple_projects = \
-            sorted([p for p in instance.STARTUP_COST_SIMPLE_PRJS])
+            sorted(instance.STARTUP_COST_SIMPLE_PRJS)
 
         self.assertListEqual(expected_startup_cost_simple_projects,
                              actual_startup_cost_simple_projects)
@@ -206,7 +206,7 @@ class TestOperationsInit(unittest.TestCase):
         )
 
         actual_startup_by_st_projects = \
-            sorted([p for p in instance.STARTUP_BY_ST_PRJS])
+            sorted(instance.STARTUP_BY_ST_PRJS)
 
         self.assertListEqual(expected_startup_by_st_projects,
                              actual_startup_by_st_projects)
@@ -218,7 +218,7 @@ class TestOperationsInit(unittest.TestCase):
         )))
 
         actual_startup_cost_all_projects = \
-            sorted([p for p in instance.STARTUP_COST_PRJS])
+            sorted(instance.STARTUP_COST_PRJS)
 
         self.assertListEqual(expected_startup_cost_all_projects,
                              actual_startup_cost_all_projects)
@@ -231,7 +231,7 @@ class TestOperationsInit(unittest.TestCase):
         )
 
         actual_shutdown_cost_projects = \
-            sorted([p for p in instance.SHUTDOWN_COST_PRJS])
+            sorted(instance.SHUTDOWN_COST_PRJS)
 
         self.assertListEqual(expected_shutdown_cost_projects,
                              actual_shutdown_cost_projects)
@@ -241,7 +241,7 @@ class TestOperationsInit(unittest.TestCase):
             projects_df[projects_df["fuel"] != "."]["project"].tolist()
         )
 
-        actual_fuel_projects = sorted([p for p in instance.FUEL_PRJS])
+        actual_fuel_projects = sorted(instance.FUEL_PRJS)
 
         self.assertListEqual(expected_fuel_projects,
                              actual_fuel_projects)
@@ -298,7 +298,7 @@ class TestOperationsInit(unittest.TestCase):
         )
 
         actual_hr_curve_projects = \
-            sorted([p for p in instance.HR_CURVE_PRJS])
+            sorted(instance.HR_CURVE_PRJS)
 
         self.assertListEqual(expected_hr_curve_projects,
                              actual_hr_curve_projects)
@@ -391,7 +391,7 @@ class TestOperationsInit(unittest.TestCase):
         )
 
         actual_curtailment_cost_projects = \
-            sorted([p for p in instance.CURTAILMENT_COST_PRJS])
+            sorted(instance.CURTAILMENT_COST_PRJS)
 
         self.assertListEqual(expected_curtailment_cost_projects,
                              actual_curtailment_cost_projects)
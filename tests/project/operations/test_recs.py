@@ -101,7 +101,7 @@ class TestRECs(unittest.TestCase):
 
         # Set: RPS_PRJS
         expected_rps_projects = sorted(["Wind", "Wind_z2"])
-        actual_rps_projects = sorted([p for p in instance.RPS_PRJS])
+        actual_rps_projects = sorted(instance.RPS_PRJS)
         self.assertListEqual(expected_rps_projects, actual_rps_projects)
 
         # Param: rps_zone
@@ -105,7 +105,7 @@ class TestProjPRMInit(unittest.TestCase):
             "Disp_Binary_Commit", "Disp_Cont_Commit", "Disp_No_Commit",
             "Clunky_Old_Gen", "Clunky_Old_Gen2", "Nuclear_Flexible"]
             )
-        actual_projects = sorted([prj for prj in instance.PRM_PROJECTS])
+        actual_projects = sorted(instance.PRM_PROJECTS)
 
         self.assertListEqual(expected_projects, actual_projects)
 
@@ -189,7 +189,7 @@ class TestProjPRMInit(unittest.TestCase):
             ])
         }
         actual_projects_by_zone = {
-            z: sorted([prj for prj in instance.PRM_PROJECTS_BY_PRM_ZONE[z]])
+            z: sorted(instance.PRM_PROJECTS_BY_PRM_ZONE[z])
             for z in instance.PRM_ZONES
         }
 
@@ -0,0 +1,111 @@
+# Copyright 2016-2020 Blue Marble Analytics LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import unittest
+
+import gridpath.project.common_functions as project_common_functions
+
+
+class TestProjectCommonFunctions(unittest.TestCase):
+    """
+
+    """
+    def setUp(self):
+        """
+        Write a small projects.tab to a temporary scenario directory
+        """
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        os.makedirs(os.path.join(self.tmp_dir.name, "inputs"))
+        self.projects_file = os.path.join(
+            self.tmp_dir.name, "inputs", "projects.tab"
+        )
+        self.write_projects_tab(
+            "project\tload_zone\n"
+            "Gas_CCGT\tZone1\n"
+            "Wind\tZone1\n"
+        )
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def write_projects_tab(self, contents):
+        with open(self.projects_file, "w") as f:
+            f.write(contents)
+
+    def read_projects_tab(self):
+        return project_common_functions.read_projects_tab(
+            scenario_directory=self.tmp_dir.name, subproblem="", stage=""
+        )
+
+    def test_read_projects_tab_after_rewrite(self):
+        """
+        Check that a rewritten projects.tab is read again rather than
+        returned from the cache
+        """
+        self.assertListEqual(
+            ["Gas_CCGT", "Wind"], self.read_projects_tab()["project"].tolist()
+        )
+
+        # Different size
+        self.write_projects_tab(
+            "project\tload_zone\n"
+            "Gas_CCGT\tZone1\n"
+            "Wind\tZone1\n"
+            "Solar\tZone2\n"
+        )
+        self.assertListEqual(
+            ["Gas_CCGT", "Wind", "Solar"],
+            self.read_projects_tab()["project"].tolist()
+        )
+
+        # Same size, later modification time
+        file_stat = os.stat(self.projects_file)
+        self.write_projects_tab(
+            "project\tload_zone\n"
+            "Gas_CCGT\tZone1\n"
+            "Wind\tZone1\n"
+            "Solar\tZone3\n"
+        )
+        os.utime(
+            self.projects_file,
+            ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 10**9)
+        )
+        self.assertListEqual(
+            ["Zone1", "Zone1", "Zone3"],
+            self.read_projects_tab()["load_zone"].tolist()
+        )
+
+    def test_read_projects_tab_returns_copies(self):
+        """
+        Check that changing a returned DataFrame does not change what the
+        next caller gets
+        """
+        first_df = self.read_projects_tab()
+        first_df.loc[0, "load_zone"] = "Zone2"
+        first_df["new_column"] = 1
+        first_df.drop(index=1, inplace=True)
+
+        second_df = self.read_projects_tab()
+        self.assertListEqual(
+            ["project", "load_zone"], second_df.columns.tolist()
+        )
+        self.assertListEqual(
+            ["Zone1", "Zone1"], second_df["load_zone"].tolist()
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
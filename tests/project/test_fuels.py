@@ -108,7 +108,7 @@ class TestFuels(unittest.TestCase):
 
         # Set: FUELS
         expected_fuels = sorted(fuels_df['FUELS'].tolist())
-        actual_fuels = sorted([fuel for fuel in instance.FUELS])
+        actual_fuels = sorted(instance.FUELS)
         self.assertListEqual(expected_fuels, actual_fuels)
 
         # Param: co2_intensity_tons_per_mmbtu
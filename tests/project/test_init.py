@@ -14,17 +14,13 @@
 
 from __future__ import print_function
 
-from builtins import str
-from builtins import object
-from collections import OrderedDict
 from importlib import import_module
 import os.path
 import pandas as pd
-import sys
 import unittest
 
-from tests.common_functions import create_abstract_model, \
-    add_components_and_load_data
+from tests.common_functions import add_components_and_load_data, \
+    get_prereq_modules
 
 
 TEST_DATA_DIRECTORY = \
@@ -35,14 +31,7 @@ PREREQUISITE_MODULE_NAMES = [
      "temporal.operations.timepoints", "temporal.operations.horizons",
      "temporal.investment.periods", "geography.load_zones"]
 NAME_OF_MODULE_BEING_TESTED = "project"
-IMPORTED_PREREQ_MODULES = list()
-for mdl in PREREQUISITE_MODULE_NAMES:
-    try:
-        imported_module = import_module("." + str(mdl), package='gridpath')
-        IMPORTED_PREREQ_MODULES.append(imported_module)
-    except ImportError:
-        print("ERROR! Module " + str(mdl) + " not found.")
-        sys.exit(1)
+IMPORTED_PREREQ_MODULES = get_prereq_modules(PREREQUISITE_MODULE_NAMES)
 # Import the module we'll test
 try:
     MODULE_BEING_TESTED = import_module("." + NAME_OF_MODULE_BEING_TESTED,
@@ -56,40 +45,37 @@ class TestProjectInit(unittest.TestCase):
     """
 
     """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Add the model components and load the data once for all tests
+        """
+        cls.m, cls.data = add_components_and_load_data(
+            prereq_modules=IMPORTED_PREREQ_MODULES,
+            module_to_test=MODULE_BEING_TESTED,
+            test_data_dir=TEST_DATA_DIRECTORY,
+            subproblem="",
+            stage=""
+        )
+
     def test_add_model_components(self):
         """
         Test that there are no errors when adding model components
         """
-        create_abstract_model(prereq_modules=IMPORTED_PREREQ_MODULES,
-                              module_to_test=MODULE_BEING_TESTED,
-                              test_data_dir=TEST_DATA_DIRECTORY,
-                              subproblem="",
-                              stage=""
-                              )
+        self.assertIsNotNone(self.m)
 
     def test_load_model_data(self):
         """
         Test that data are loaded with no errors
         """
-        add_components_and_load_data(prereq_modules=IMPORTED_PREREQ_MODULES,
-                                     module_to_test=MODULE_BEING_TESTED,
-                                     test_data_dir=TEST_DATA_DIRECTORY,
-                                     subproblem="",
-                                     stage=""
-                                     )
+        self.assertIsNotNone(self.data)
 
     def test_initialized_components(self):
         """
         Create components; check they are initialized with data as expected
         """
-        m, data = add_components_and_load_data(
-            prereq_modules=IMPORTED_PREREQ_MODULES,
-            module_to_test=MODULE_BEING_TESTED,
-            test_data_dir=TEST_DATA_DIRECTORY,
-            subproblem="",
-            stage=""
-        )
-        instance = m.create_instance(data)
+        instance = self.m.create_instance(self.data)
 
         # Load test data
         projects_df = \
@@ -100,78 +86,26 @@ class TestProjectInit(unittest.TestCase):
                     "availability_type", "operational_type"
                 ]
             )
+        expected_project_params = projects_df.set_index('project').to_dict()
 
         # Check data are as expected
         # PROJECTS
         expected_projects = sorted(projects_df['project'].tolist())
-        actual_projects = sorted([prj for prj in instance.PROJECTS])
+        actual_projects = sorted(instance.PROJECTS)
 
         self.assertListEqual(expected_projects, actual_projects)
 
-        # Params: load_zone
-        expected_load_zone = OrderedDict(
-            sorted(
-                projects_df.set_index('project').to_dict()['load_zone'].items()
-            )
-        )
-        actual_load_zone = OrderedDict(
-            sorted(
-                {prj: instance.load_zone[prj] for prj in
-                 instance.PROJECTS}.items()
-            )
-        )
-        self.assertDictEqual(expected_load_zone, actual_load_zone)
-
-        # Params: capacity_type
-        expected_cap_type = OrderedDict(
-            sorted(
-                projects_df.set_index('project').to_dict()[
-                    'capacity_type'].items()
-            )
-        )
-
-        actual_cap_type = OrderedDict(
-            sorted(
-                {prj: instance.capacity_type[prj] for prj in
-                 instance.PROJECTS}.items()
-            )
-        )
-
-        self.assertDictEqual(expected_cap_type, actual_cap_type)
-
-        # Params: availability_type
-        expected_availability_type = OrderedDict(
-            sorted(
-                projects_df.set_index('project').to_dict()['availability_type']
-                .items()
-            )
-        )
-        actual_availability_type = OrderedDict(
-            sorted(
-                {prj: instance.availability_type[prj] for prj in
-                 instance.PROJECTS}.items()
-            )
-        )
-
-        self.assertDictEqual(expected_availability_type,
-                             actual_availability_type)
-
-        # Params: operational_type
-        expected_op_type = OrderedDict(
-            sorted(
-                projects_df.set_index('project').to_dict()[
-                    'operational_type'].items()
-            )
-        )
-
-        actual_op_type = OrderedDict(
-            sorted(
-                {prj: instance.operational_type[prj] for prj in
-                 instance.PROJECTS}.items()
-            )
-        )
-
-        self.assertDictEqual(expected_op_type, actual_op_type)
+        # Params: load_zone, capacity_type, availability_type,
+        # operational_type
+        for param in ["load_zone", "capacity_type", "availability_type",
+                      "operational_type"]:
+            with self.subTest(param=param):
+                actual_param = {
+                    prj: getattr(instance, param)[prj]
+                    for prj in instance.PROJECTS
+                }
+                self.assertDictEqual(expected_project_params[param],
+                                     actual_param)
 
 
 if __name__ == "__main__":
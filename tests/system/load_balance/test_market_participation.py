@@ -104,7 +104,7 @@ class TestMarketParticipation(unittest.TestCase):
 
         # Set: MARKET_LZS
         expected_market_lzs = sorted(["Zone1", "Zone2"])
-        actual_market_lzs = sorted([z for z in instance.MARKET_LZS])
+        actual_market_lzs = sorted(instance.MARKET_LZS)
         self.assertListEqual(expected_market_lzs, actual_market_lzs)
 
         # Set: MARKETS_BY_LZ
@@ -165,7 +165,7 @@ class TestPeriods(unittest.TestCase):
                 expected_tmp_in_p[expected_period_param[tmp]].append(tmp)
 
         actual_tmps_in_p = {
-            p: sorted([tmp for tmp in instance.TMPS_IN_PRD[p]])
+            p: sorted(instance.TMPS_IN_PRD[p])
             for p in list(instance.TMPS_IN_PRD.keys())
             }
         self.assertDictEqual(expected_tmp_in_p, actual_tmps_in_p,
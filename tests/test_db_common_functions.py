@@ -0,0 +1,80 @@
+# Copyright 2016-2020 Blue Marble Analytics LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from db.common_functions import connect_to_database
+
+
+class TestConnectToDatabase(unittest.TestCase):
+    """
+    Check the read-only database connection
+    """
+
+    def setUp(self):
+        """
+        Create a small database in a directory whose name has characters
+        that must be escaped in a URI
+        """
+        self.tmp_dir = tempfile.TemporaryDirectory(prefix="gp #1 %20")
+        self.db_path = os.path.join(self.tmp_dir.name, "test.db")
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("CREATE TABLE test_table (value INTEGER);")
+        conn.execute("INSERT INTO test_table VALUES (1);")
+        conn.commit()
+        conn.close()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_read_only_connection(self):
+        """
+        Check that a read-only connection reads the database and that a
+        write through it raises an error and changes nothing
+        """
+        conn = connect_to_database(db_path=self.db_path, read_only=True)
+        self.assertListEqual(
+            [(1,)], conn.execute("SELECT value FROM test_table;").fetchall()
+        )
+        with self.assertRaises(sqlite3.OperationalError):
+            conn.execute("INSERT INTO test_table VALUES (2);")
+        conn.close()
+
+        # Nothing was written and no other database file was created
+        conn = connect_to_database(db_path=self.db_path)
+        self.assertListEqual(
+            [(1,)], conn.execute("SELECT value FROM test_table;").fetchall()
+        )
+        conn.close()
+        self.assertListEqual(["test.db"], os.listdir(self.tmp_dir.name))
+
+    def test_read_write_connection(self):
+        """
+        Check that the default connection can write to the database
+        """
+        conn = connect_to_database(db_path=self.db_path)
+        conn.execute("INSERT INTO test_table VALUES (2);")
+        conn.commit()
+        self.assertListEqual(
+            [(1,), (2,)],
+            conn.execute("SELECT value FROM test_table;").fetchall()
+        )
+        conn.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -14,15 +14,12 @@
 
 from __future__ import print_function
 
-from builtins import str
-from collections import OrderedDict
 from importlib import import_module
 import os.path
-import sys
 import unittest
 
-from tests.common_functions import create_abstract_model, \
-    add_components_and_load_data
+from tests.common_functions import add_components_and_load_data, \
+    get_prereq_modules
 
 TEST_DATA_DIRECTORY = \
     os.path.join(os.path.dirname(__file__), "..", "..", "..", "test_data")
@@ -33,14 +30,7 @@ PREREQUISITE_MODULE_NAMES = [
     "geography.load_zones", "transmission"]
 NAME_OF_MODULE_BEING_TESTED = \
     "transmission.capacity.capacity_types.tx_spec"
-IMPORTED_PREREQ_MODULES = list()
-for mdl in PREREQUISITE_MODULE_NAMES:
-    try:
-        imported_module = import_module("." + str(mdl), package='gridpath')
-        IMPORTED_PREREQ_MODULES.append(imported_module)
-    except ImportError:
-        print("ERROR! Module " + str(mdl) + " not found.")
-        sys.exit(1)
+IMPORTED_PREREQ_MODULES = get_prereq_modules(PREREQUISITE_MODULE_NAMES)
 # Import the module we'll test
 try:
     MODULE_BEING_TESTED = import_module("." + NAME_OF_MODULE_BEING_TESTED,
@@ -49,92 +39,77 @@ except ImportError:
     print("ERROR! Couldn't import module " + NAME_OF_MODULE_BEING_TESTED +
           " to test.")
 
+# Expected values
+EXPECTED_PERIODS = [("Tx1", 2020), ("Tx1", 2030),
+                    ("Tx2", 2020), ("Tx2", 2030),
+                    ("Tx3", 2020), ("Tx3", 2030)
+                    ]
+EXPECTED_MIN = {
+    ("Tx1", 2020): -10, ("Tx1", 2030): -10,
+    ("Tx2", 2020): -10, ("Tx2", 2030): -10,
+    ("Tx3", 2020): -10, ("Tx3", 2030): -10
+}
+EXPECTED_MAX = {
+    ("Tx1", 2020): 10, ("Tx1", 2030): 10,
+    ("Tx2", 2020): 10, ("Tx2", 2030): 10,
+    ("Tx3", 2020): 10, ("Tx3", 2030): 10
+}
+
 
 class TestSpecifiedTransmission(unittest.TestCase):
     """
 
     """
 
+    @classmethod
+    def setUpClass(cls):
+        """
+        Add the model components and load the data once for all tests
+        :return:
+        """
+        cls.m, cls.data = add_components_and_load_data(
+            prereq_modules=IMPORTED_PREREQ_MODULES,
+            module_to_test=MODULE_BEING_TESTED,
+            test_data_dir=TEST_DATA_DIRECTORY,
+            subproblem="",
+            stage=""
+        )
+
     def test_add_model_components(self):
         """
         Test that there are no errors when adding model components
         :return:
         """
-        create_abstract_model(prereq_modules=IMPORTED_PREREQ_MODULES,
-                              module_to_test=MODULE_BEING_TESTED,
-                              test_data_dir=TEST_DATA_DIRECTORY,
-                              subproblem="",
-                              stage=""
-                              )
+        self.assertIsNotNone(self.m)
 
     def test_load_model_data(self):
         """
         Test that data are loaded with no errors
         :return:
         """
-        add_components_and_load_data(prereq_modules=IMPORTED_PREREQ_MODULES,
-                                     module_to_test=MODULE_BEING_TESTED,
-                                     test_data_dir=TEST_DATA_DIRECTORY,
-                                     subproblem="",
-                                     stage=""
-                                     )
+        self.assertIsNotNone(self.data)
 
     def test_data_loaded_correctly(self):
         """
         Test that the data loaded are as expected
         :return:
         """
-        m, data = add_components_and_load_data(
-            prereq_modules=IMPORTED_PREREQ_MODULES,
-            module_to_test=MODULE_BEING_TESTED,
-            test_data_dir=TEST_DATA_DIRECTORY,
-            subproblem="",
-            stage=""
-        )
-        instance = m.create_instance(data)
+        instance = self.m.create_instance(self.data)
 
         # Set: TX_SPEC_OPR_PRDS
-        expected_periods = [("Tx1", 2020), ("Tx1", 2030),
-                            ("Tx2", 2020), ("Tx2", 2030),
-                            ("Tx3", 2020), ("Tx3", 2030)
-                            ]
-        actual_periods = sorted([
-            (tx, p) for (tx, p)
-            in instance.TX_SPEC_OPR_PRDS
-            ])
-        self.assertListEqual(expected_periods, actual_periods)
-
-        # Param: tx_spec_min_flow_mw
-        expected_min = OrderedDict(sorted({
-            ("Tx1", 2020): -10, ("Tx1", 2030): -10,
-            ("Tx2", 2020): -10, ("Tx2", 2030): -10,
-            ("Tx3", 2020): -10, ("Tx3", 2030): -10
-                                          }.items()
-                                          )
-                                   )
-        actual_min = OrderedDict(sorted({
-            (tx, p): instance.tx_spec_min_flow_mw[tx, p] for (tx, p)
-            in instance.TX_SPEC_OPR_PRDS
-                                        }.items()
-                                        )
-                                 )
-        self.assertDictEqual(expected_min, actual_min)
-
-        # Param: specified_tx_max_mw
-        expected_max = OrderedDict(sorted({
-            ("Tx1", 2020): 10, ("Tx1", 2030): 10,
-            ("Tx2", 2020): 10, ("Tx2", 2030): 10,
-            ("Tx3", 2020): 10, ("Tx3", 2030): 10
-                                          }.items()
-                                          )
-                                   )
-        actual_max = OrderedDict(sorted({
-            (tx, p): instance.tx_spec_max_flow_mw[tx, p] for (tx, p)
-            in instance.TX_SPEC_OPR_PRDS
-                                        }.items()
-                                        )
-                                 )
-        self.assertDictEqual(expected_max, actual_max)
+        actual_periods = sorted(instance.TX_SPEC_OPR_PRDS)
+        self.assertListEqual(EXPECTED_PERIODS, actual_periods)
+
+        # Params: tx_spec_min_flow_mw, tx_spec_max_flow_mw
+        for param, expected_param in [("tx_spec_min_flow_mw", EXPECTED_MIN),
+                                      ("tx_spec_max_flow_mw", EXPECTED_MAX)]:
+            with self.subTest(param=param):
+                actual_param = {
+                    (tx, p): getattr(instance, param)[tx, p] for (tx, p)
+                    in instance.TX_SPEC_OPR_PRDS
+                }
+                self.assertDictEqual(expected_param, actual_param)
+
 
 if __name__ == "__main__":
     unittest.main()
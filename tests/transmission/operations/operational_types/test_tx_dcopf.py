@@ -283,7 +283,7 @@ class TestTxOperations(unittest.TestCase):
         actual_zones = OrderedDict(
             sorted(
                 {(p, c):
-                 sorted([z for z in instance.ZONES_IN_PRD_CYCLE[(p, c)]])
+                 sorted(instance.ZONES_IN_PRD_CYCLE[(p, c)])
                  for (p, c) in instance.PRDS_CYCLES}.items()
             )
         )
@@ -94,7 +94,7 @@ class TestTransmissionInit(unittest.TestCase):
 
         # Set: TX_LINES
         expected_tx_lines = sorted(["Tx1", "Tx2", "Tx3", "Tx_New"])
-        actual_tx_lines = sorted([tx for tx in instance.TX_LINES])
+        actual_tx_lines = sorted(instance.TX_LINES)
         self.assertListEqual(expected_tx_lines, actual_tx_lines)
 
         # Param: tx_capacity_type
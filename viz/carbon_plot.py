@@ -115,7 +115,7 @@ def get_plotting_data(conn, scenario_id, carbon_cap_zone, subproblem, stage,
     # )
 
     # Change period type from int to string (required for categorical bar chart)
-    df["period"] = df["period"].map(str)
+    df["period"] = df["period"].astype(str)
 
     # TODO: division will fail if total_emissions_degen is NULL, e.g. when
     #  there are no carbon transmission lines.
@@ -96,7 +96,9 @@ def get_plotting_data(conn, scenario_id, rps_zone, subproblem, stage,
             curtailed_rps_energy_mwh, 
             fraction_of_rps_target_met, 
             fraction_of_rps_energy_curtailed,
-            rps_marginal_cost_per_mwh
+            rps_marginal_cost_per_mwh,
+            1 - fraction_of_rps_energy_curtailed
+                AS fraction_of_rps_energy_delivered
         FROM results_system_rps
         WHERE scenario_id = ?
         AND rps_zone = ?
@@ -111,15 +113,24 @@ def get_plotting_data(conn, scenario_id, rps_zone, subproblem, stage,
     )
 
     # Change period type from int to string (required for categorical bar chart)
-    df["period"] = df["period"].map(str)
-
-    # Add rps delivered fraction
-    df["fraction_of_rps_energy_delivered"] = \
-        1 - df["fraction_of_rps_energy_curtailed"]
+    df["period"] = df["period"].astype(str)
 
     return df
 
 
+def add_hover_tool(plot, renderer, tooltips):
+    """
+    Add a non-toggleable HoverTool with the given tooltips for a renderer
+    :param plot: the Bokeh figure
+    :param renderer: the renderer the HoverTool applies to
+    :param tooltips: list of (label, value) tooltip tuples
+    :return:
+    """
+    plot.add_tools(
+        HoverTool(tooltips=tooltips, renderers=[renderer], toggleable=False)
+    )
+
+
 def create_plot(df, title, energy_unit, cost_unit, ylimit=None):
     """
 
@@ -201,43 +212,41 @@ def create_plot(df, title, energy_unit, cost_unit, ylimit=None):
     plot.y_range.end = ylimit  # will be ignored if ylimit is None
 
     # Add delivered RPS HoverTool
-    r_delivered = bar_renderers[0]  # renderer for delivered RPS
-    hover = HoverTool(
+    add_hover_tool(
+        plot=plot,
+        renderer=bar_renderers[0],
         tooltips=[
             ("Period", "@period"),
             ("Delivered RPS Energy",
              "@%s{0,0} %s (@fraction_of_rps_energy_delivered{0%%})"
              % (stacked_cols[0], energy_unit)),
-        ],
-        renderers=[r_delivered],
-        toggleable=False)
-    plot.add_tools(hover)
+        ]
+    )
 
     # Add curtailed RPS HoverTool
-    r_curtailed = bar_renderers[1]  # renderer for curtailed RPS
-    hover = HoverTool(
+    add_hover_tool(
+        plot=plot,
+        renderer=bar_renderers[1],
         tooltips=[
             ("Period", "@period"),
             ("Curtailed RPS Energy",
              "@%s{0,0} %s (@fraction_of_rps_energy_curtailed{0%%})"
              % (stacked_cols[1], energy_unit)),
-        ],
-        renderers=[r_curtailed],
-        toggleable=False)
-    plot.add_tools(hover)
+        ]
+    )
 
     # Add RPS Target HoverTool
-    hover = HoverTool(
+    add_hover_tool(
+        plot=plot,
+        renderer=target_renderer,
         tooltips=[
             ("Period", "@period"),
             ("RPS Target", "@%s{0,0} %s" % (line_col, energy_unit)),
             ("Fraction of RPS Met", "@fraction_of_rps_target_met{0%}"),
             ("Marginal Cost", "@rps_marginal_cost_per_mwh{0,0} %s/%s"
              % (cost_unit, energy_unit))
-        ],
-        renderers=[target_renderer],
-        toggleable=False)
-    plot.add_tools(hover)
+        ]
+    )
 
     return plot
 
@@ -252,7 +261,8 @@ def main(args=None):
         args = sys.argv[1:]
     parsed_args = parse_arguments(arguments=args)
 
-    conn = connect_to_database(db_path=parsed_args.database)
+    conn = connect_to_database(db_path=parsed_args.database,
+                               read_only=True)
     c = conn.cursor()
 
     scenario_id, scenario = get_scenario_id_and_name(